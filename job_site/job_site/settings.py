@@ -22,6 +22,8 @@ PLAYWRIGHT_BROWSER_TYPE = "chromium"  # Choose 'chromium', 'firefox', or 'webkit
 PLAYWRIGHT_LAUNCH_OPTIONS = {
     "headless": False,  # Set to True if you prefer headless mode
 }
+PLAYWRIGHT_MAX_CONTEXTS = 1  # Reuse one long-lived browser context instead of creating one per request
+PLAYWRIGHT_MAX_PAGES_PER_CONTEXT = 16  # Pages that may be open concurrently within that context
 # end of Play-write specific settings -----------------
 
 # Crawl responsibly by identifying yourself (and your website) on the user-agent
@@ -1,16 +1,33 @@
 import scrapy
 from scrapy_playwright.page import PageMethod
-import math
+import functools
 from scrapy.loader import ItemLoader
+from parsel.csstranslator import css2xpath
 from ..items import JobContainerItem
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
+def _read_js_template() -> str:
+    """ Reads the page interaction JavaScript template once and caches it for every spider instance.
+    """
+    return Path(__file__).with_name("page_method.js").read_text()
+
+
 class GetJobsSpider(scrapy.Spider):
     name = "get_jobs"  # The name of the spider
     allowed_domains = ["www.workingnomads.com"]  # Allowed domains for the spider
     start_urls = ["https://www.workingnomads.com/jobs"]  # The URL the spider will start from
 
+    # CSS selectors translated to XPath once at class load rather than on every add_css call for every job row
+    JOB_ROW_XP = css2xpath('div.jobs-list div.ng-scope div.job-wrapper')
+    JOB_NAME_XP = css2xpath('h4.hidden-xs a.open-button.ng-binding::text')
+    JOB_LINK_XP = css2xpath('a.open-button.ng-binding::attr(ng-href)')
+    COMPANY_NAME_XP = css2xpath('div.company.hidden-xs a::text')
+    JOB_LOCATION_XP = css2xpath('div.box i.fa-map-marker + span::text')
+    WORK_TYPE_XP = css2xpath('div.box i.fa-clock-o + span::text')
+    TAGS_XP = './/div[contains(@class, "box") and contains(@class, "hidden-xs") and contains(@class, "ng-scope")]/a/text()'
+
     def __init__(self, n_listings=200, **kwargs):
         """ Initialization method to set up the number of listings required and the JS code for page interaction.
         param n_listings: The total number of job listings the spider should scrape
@@ -25,10 +42,9 @@ class GetJobsSpider(scrapy.Spider):
         return: The modified JavaScript code with the appropriate number of pages to load
         """
         jobs_per_page = 50  # How many jobs does the site load per page? This may change
-        load_pages = math.ceil(self.required_jobs / jobs_per_page) - 1  # Calculate how many pages to load
-        file_path = Path.joinpath(Path.cwd(), "job_site/spiders/page_method.js")  # Path to the JS code
-        with open(file_path, "r") as js_file:
-            js_code = js_file.read()  # Read the JavaScript code from the file
+        # Calculate how many extra pages to load (integer ceiling division, never negative)
+        load_pages = max(0, (self.required_jobs + jobs_per_page - 1) // jobs_per_page - 1)
+        js_code = _read_js_template()  # Read the JavaScript code from the file (cached after the first read)
 
         # Replace placeholders in the JS code with the correct values
         js_code = js_code.replace("LOAD_PAGES", str(load_pages))
@@ -44,6 +60,8 @@ class GetJobsSpider(scrapy.Spider):
             self.start_urls[0],  # The URL to start scraping from
             meta=dict(
                 playwright=True,  # Enable Playwright to handle JavaScript
+                playwright_context="jobs",  # Pin the request to the shared, long-lived browser context
+                playwright_include_page=False,  # Let the page close after the request; the context persists
                 playwright_page_methods=[  # List of Playwright methods to run on the page
                     PageMethod("wait_for_selector", 'div.jobs-list div.job-wrapper'),  # Wait for job elements to load
                     PageMethod("wait_for_selector", "#accept-btn"),  # Wait for the accept button
@@ -57,30 +75,30 @@ class GetJobsSpider(scrapy.Spider):
         """ This callback function processes the response and extracts job data. """
 
         count = 0  # Initialize count
+        rows = response.selector.xpath(self.JOB_ROW_XP)  # Select the job rows once from the cached response selector
 
         # Loop through each job in the response
-        for job in response.css('div.jobs-list div.ng-scope div.job-wrapper'):
+        for job in rows:
 
             if count >= self.required_jobs:  # Stop when enough jobs are collected
                 break
 
-            job_title = job.css('h4.hidden-xs a.open-button.ng-binding::text').get()
+            job_title = job.xpath(self.JOB_NAME_XP).get()
 
             if job_title and job_title.strip():  # Ensure job title is valid
                 count += 1
-                item = ItemLoader(item=JobContainerItem(), selector=job)  # Initialize item loader
+                # Initialize item loader on the row selector only (passing response= would re-wrap the full document)
+                item = ItemLoader(item=JobContainerItem(), selector=job)
 
                 # Add job details
-                item.add_css("job_name", 'h4.hidden-xs a.open-button.ng-binding::text')
-                item.add_css("job_link", 'a.open-button.ng-binding::attr(ng-href)')
-                item.add_css("company_name", 'div.company.hidden-xs a::text')
-                item.add_css("job_location", 'div.box i.fa-map-marker + span::text')
-                item.add_css("work_type", 'div.box i.fa-clock-o + span::text')
+                item.add_value("job_name", job_title)  # Reuse the title already extracted above
+                item.add_xpath("job_link", self.JOB_LINK_XP)
+                item.add_xpath("company_name", self.COMPANY_NAME_XP)
+                item.add_xpath("job_location", self.JOB_LOCATION_XP)
+                item.add_xpath("work_type", self.WORK_TYPE_XP)
 
                 # Extract job tags
-                tags = job.xpath(
-                    './/div[contains(@class, "box") and contains(@class, "hidden-xs") and contains(@class, "ng-scope")]/a/text()'
-                ).getall()
+                tags = job.xpath(self.TAGS_XP).getall()
                 item.add_value("tags", tags)
 
                 # Yield the item
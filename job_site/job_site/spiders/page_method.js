@@ -1,17 +1,39 @@
 let count = 0;  // Initialize a counter to track the number of "Load More" clicks
 const load_pages = LOAD_PAGES;  // Placeholder for injected Python variable (number of pages to load)
-const click_timeout = CLICK_TIMEOUT;  // Placeholder for injected Python variable (timeout between clicks)
+const click_timeout = CLICK_TIMEOUT;  // Placeholder for injected Python variable (max wait for new jobs after a click)
+
+function waitForMoreJobs(prev) {
+    // Resolve as soon as more jobs than `prev` are rendered, or after click_timeout as a fallback ceiling
+    return new Promise(resolve => {
+        const done = () => {
+            obs.disconnect();
+            clearTimeout(timer);
+            resolve();
+        };
+        const obs = new MutationObserver(() => {
+            if (document.querySelectorAll('div.jobs-list div.job-wrapper').length > prev) {
+                done();
+            }
+        });
+        const timer = setTimeout(done, click_timeout);
+        if (document.querySelectorAll('div.jobs-list div.job-wrapper').length > prev) {
+            return done();  // The new jobs were already rendered synchronously by the click
+        }
+        obs.observe(document.querySelector('div.jobs-list') || document.body, { childList: true, subtree: true });
+    });
+}
 
 async function clickLoadMore() {
     while (count < load_pages) {  // Continue clicking while the count is less than the number of pages
         const button = document.querySelector('div.show-more');  // Find the "Load More" button using its CSS selector
 
         if (button) {  // If the "Load More" button exists on the page
+            const prev = document.querySelectorAll('div.jobs-list div.job-wrapper').length;  // Jobs rendered before the click
             button.scrollIntoView({ behavior: 'smooth', block: 'center' });  // Scroll the button into view smoothly
             button.click();  // Click the "Load More" button
             count++;  // Increment the counter after each click
             console.log("Clicked, count:", count);  // Debug log to track how many times the button has been clicked
-            await new Promise(resolve => setTimeout(resolve, click_timeout));  // Wait for the specified timeout before the next click
+            await waitForMoreJobs(prev);  // Wait until the new jobs are rendered (at most click_timeout)
         } else {
             break;  // If no "Load More" button is found, stop the loop
         }
@@ -1,6 +1,7 @@
 import logging
 import os
-from httpx import get, HTTPStatusError
+from concurrent.futures import ThreadPoolExecutor
+from httpx import Client, HTTPStatusError
 from playwright.sync_api import sync_playwright
 
 # Configure logging settings to provide timestamped info and error messages
@@ -97,45 +98,60 @@ def get_response_for(keyword: str, page_number=0):
     return None
 
 
-def download_images(img_urls: list[str], term: str, tag: str = ""):
+def download_images(img_urls: list[str], term: str, tag: str = "", max_workers: int = 16):
     """
-    Downloads images from the given list of URLs and saves them locally.
+    Downloads images from the given list of URLs in parallel and saves them locally.
 
-    Each image is fetched using an HTTP request, and saved into a directory named after the search term.
-    If a tag is provided, it is prefixed to the filename. The function also logs download status and handles
-    errors gracefully.
+    Images are fetched by a pool of worker threads sharing one HTTP/2 client, so connections and TLS handshakes
+    are reused across downloads. Each image is saved into a directory named after the search term. If a tag is
+    provided, it is prefixed to the filename.
 
     Args:
         img_urls (list[str]): A list of image URLs to download.
         term (str): The search term used, which determines the subfolder name.
         tag (str, optional): An optional tag to be prefixed to file names. Defaults to an empty string.
+        max_workers (int, optional): The number of images to download concurrently. Defaults to 16.
     """
-    for i, url in enumerate(img_urls):
-        try:
-            logging.info(f"Downloading image {i} of {len(img_urls)}.")
-            resp = get(url)
-            resp.raise_for_status()  # Raise error if HTTP request fails
-            logging.info(f"Downloading {url}...")
+    dest_dir = f'outputs/{term}'  # Define output directory path based on search term
+    os.makedirs(dest_dir, exist_ok=True)  # Create directory if it does not exist
 
-            dest_dir = f'outputs/{term}'  # Define output directory path based on search term
-            file_name = url.split("/")[-1]  # Extract filename from URL
+    with ThreadPoolExecutor(max_workers=max_workers) as ex, Client(http2=True, timeout=30) as client:
+        list(ex.map(lambda iu: _download_one(client, iu[1], dest_dir, tag, iu[0], len(img_urls)), enumerate(img_urls)))
 
-            if not os.path.exists(dest_dir):
-                os.makedirs(dest_dir)  # Create directory if it does not exist
 
-            # Construct file path, avoiding unnecessary '-' if the tag is empty
-            file_path = f"{dest_dir}/{f'{tag}-' if tag else ''}{file_name}.jpeg"
+def _download_one(client: Client, url: str, dest_dir: str, tag: str, index: int, total: int):
+    """
+    Downloads a single image and saves it to dest_dir, logging (rather than raising) any errors.
+
+    Args:
+        client (Client): The shared HTTP client.
+        url (str): The image URL to download.
+        dest_dir (str): The directory to save the image in.
+        tag (str): An optional tag to be prefixed to the file name.
+        index (int): The position of this image in the download list, for progress logging.
+        total (int): The total number of images being downloaded, for progress logging.
+    """
+    try:
+        logging.info(f"Downloading image {index} of {total}.")
+        logging.info(f"Downloading {url}...")
+        resp = client.get(url)
+        resp.raise_for_status()  # Raise error if HTTP request fails
 
-            # Save image to the specified directory
-            with open(file_path, "wb") as f:
-                f.write(resp.content)  # Write binary content to file
-                logging.info(f"Saved {file_name}, with size {round(len(resp.content) / 1024 / 1024, 2)} MB.")
+        file_name = url.split("/")[-1]  # Extract filename from URL
 
-        except HTTPStatusError as e:
-            logging.error(f"Failed to download {url}: {e.response.status_code} - {e.response.text}")
+        # Construct file path, avoiding unnecessary '-' if the tag is empty
+        file_path = f"{dest_dir}/{f'{tag}-' if tag else ''}{file_name}.jpeg"
 
-        except Exception as e:
-            logging.error(f"An error occurred while downloading {url}: {e}")
+        # Save image to the specified directory
+        with open(file_path, "wb") as f:
+            f.write(resp.content)  # Write binary content to file
+            logging.info(f"Saved {file_name}, with size {round(len(resp.content) / 1024 / 1024, 2)} MB.")
+
+    except HTTPStatusError as e:
+        logging.error(f"Failed to download {url}: {e.response.status_code} - {e.response.text}")
+
+    except Exception as e:
+        logging.error(f"An error occurred while downloading {url}: {e}")
 
 
 if __name__ == "__main__":
@@ -1,12 +1,25 @@
 from extract import extract_full_body_html
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser as HTMLParser, LexborNode
+from collections.abc import Iterator
+import asyncio
+import contextlib
+import hashlib
+import json
 import logging
 import os
-from httpx import get
+import re
+import aiofiles
+import httpx
 
 # Configure logging settings
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Keywords marking unwanted (premium / watermarked / profile) image URLs
+_UNSPLASH_BLOCKLIST = ("plus", "profile", "premium")
+
+# Matches each candidate URL in a srcset attribute (e.g. "https://... 400w")
+_SRCSET_RE = re.compile(r"(https?://\S+?)\s+\d+w")
+
 
 def scrape_up_splash(terms: list[str]):
     """ Scrapes Unsplash for images related to the given search terms and saves them.
@@ -14,33 +27,46 @@ def scrape_up_splash(terms: list[str]):
     if not terms or len(terms) == 0:
         raise Exception("No search terms provided")
 
+    jobs = []  # (img_urls, term, tag) for each valid search term
+    seen: set[str] = set()  # Image URLs already queued, so overlapping results are downloaded only once
+
     for i, term in enumerate(terms):
 
         if type(term) == str:
 
-            img_nodes = get_img_tags_for(term)  # Extract image nodes from Unsplash search results
-            all_img_urls = [get_high_res_img_url(i) for i in img_nodes]  # Extract high-resolution image URLs
-            img_urls = [u for u in all_img_urls if u]  # Filter out None values
+            img_nodes = get_img_tags_for(term)  # Image nodes from Unsplash search results (page fetched on first iteration)
+            all_img_urls = (get_high_res_img_url(i) for i in img_nodes)  # Extract high-resolution image URLs
+            img_urls = (u for u in all_img_urls if u)  # Filter out None values
 
-            save_images(img_urls, term, term)  # Download and save images
+            # Materialise only the final, de-duplicated URLs: the page must be scraped before the event loop
+            # starts, since the sync Playwright API cannot run inside it
+            img_urls = [u for u in img_urls if not (u in seen or seen.add(u))]
+            jobs.append((img_urls, term, term))
 
         else:
             logging.warning(f"Input list element {i} - ({term}) is not of type string. Ignoring element")
 
+    asyncio.run(_run(jobs))  # Download and save images for all terms concurrently
+
+
+async def _run(jobs: list[tuple[list[str], str, str]]):
+    """ Downloads the images of every search term concurrently.
+    """
+    await asyncio.gather(*(save_images_async(img_urls, term, tag) for img_urls, term, tag in jobs))
+
 
-def get_img_tags_for(term: str) -> list:
+def get_img_tags_for(term: str) -> Iterator[LexborNode]:
     """ Fetches image elements from Unsplash search results.
+    The page is only fetched once the returned generator is first iterated.
     """
     url = f"https://unsplash.com/s/photos/{term}"
     html = extract_full_body_html(url)
 
     tree = HTMLParser(html)
-    imgs = tree.css('figure[data-testid*="photo-grid-masonry-figure"] a img')
+    yield from tree.css('figure[data-testid*="photo-grid-masonry-figure"] a img')
 
-    return imgs
 
-
-def img_filter_out(url: str, keywords: list[str]) -> bool:
+def img_filter_out(url: str, keywords: tuple[str, ...] = _UNSPLASH_BLOCKLIST) -> bool:
     """ Checks if an image URL contains any unwanted keywords and filters it out.
     """
     return not any(x in url for x in keywords)
@@ -49,35 +75,120 @@ def img_filter_out(url: str, keywords: list[str]) -> bool:
 def get_high_res_img_url(img_node) -> str | None:
     """ Extracts the highest-resolution image URL from the srcset attribute.
     """
-    src_set = img_node.attrs["srcset"]  # Get "srcset" attribute containing multiple image URLs
-    src_set_list = src_set.split(", ")  # Split into individual image entries
+    src_set = img_node.attrs.get("srcset") or ""  # Get "srcset" attribute containing multiple image URLs
+
+    # Return the first candidate URL without unwanted keywords, stripped of its query string
+    for match in _SRCSET_RE.finditer(src_set):
+        url = match.group(1)
+        if img_filter_out(url):
+            return url.split("?", 1)[0]
+
+    return None  # Return None if no valid image URLs remain
+
+
+async def save_images_async(img_urls: list[str], term: str, tag: str = "", concurrency: int = 16):
+    """ Downloads images from given URLs concurrently and saves them to a directory.
+    Images already on disk are revalidated with a conditional GET and only rewritten if they changed.
+    """
+    if not img_urls:
+        return  # Nothing to download, so don't create an empty output folder or manifest
+
+    dest_dir = f'outputs/{term}'  # Define output directory path
+    os.makedirs(dest_dir, exist_ok=True)  # Create directory if it does not exist
 
-    # Extract URL with the highest resolution, filtering out unwanted keywords
-    url_res = [src.split(" ") for src in src_set_list if img_filter_out(src, ['plus', 'profile', 'premium'])]
+    # Cached validators from previous runs, keyed by URL (kept out of the image folder)
+    manifest_path = f"outputs/.manifests/{term}.json"
+    manifest = _load_manifest(manifest_path)
 
-    if not url_res:
-        return None  # Return None if no valid image URLs remain
+    sem = asyncio.Semaphore(concurrency)  # Bound the number of in-flight downloads
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
 
-    return url_res[0][0].split("?")[0]  # Return the highest-resolution image URL
+    async with httpx.AsyncClient(http2=True, timeout=30, limits=limits) as client:
+        tasks = [asyncio.create_task(_fetch_and_write(sem, client, url, dest_dir, tag, manifest)) for url in img_urls]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
+    for url, result in zip(img_urls, results):
+        if isinstance(result, Exception):
+            logging.error(f"An error occurred while downloading {url}: {result}")
 
-def save_images(img_urls: list[str], term: str, tag: str = ""):
-    """ Downloads images from given URLs and saves them to a directory.
+    _save_manifest(manifest_path, manifest)
+
+
+async def _fetch_and_write(sem: asyncio.Semaphore, client: httpx.AsyncClient, url: str, dest_dir: str, tag: str,
+                           manifest: dict):
+    """ Downloads a single image and writes it to dest_dir without blocking the event loop.
     """
-    for url in img_urls:
-        resp = get(url)  # Send GET request to download image
+    file_name = url.split("/")[-1]  # Extract filename from URL
+    file_path = f"{dest_dir}/{tag}-{file_name}.jpeg"
+
+    # Only revalidate if the previously downloaded file is still on disk
+    meta = manifest.get(url) if os.path.exists(file_path) else None
+    headers = {}
+    if meta and meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta and meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    async with sem:
         logging.info(f"Downloading {url}...")
 
-        dest_dir = f'outputs/{term}'  # Define output directory path
-        file_name = url.split("/")[-1]  # Extract filename from URL
+        # Stream the body to disk in chunks so memory stays O(chunk size) per in-flight request
+        async with client.stream("GET", url, headers=headers) as resp:
+
+            if resp.status_code == 304:
+                logging.info(f"{file_name} not modified. Skipping.")
+                return
+
+            resp.raise_for_status()
+
+            tmp_path = f"{file_path}.part"  # Write to a temporary file until the body is complete
+            digest = hashlib.sha256()
+            size = 0
+
+            try:
+                async with aiofiles.open(tmp_path, "wb") as f:
+                    async for chunk in resp.aiter_bytes(65536):
+                        await f.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+            except BaseException:
+                # Never leave a partial image behind (timeout, dropped connection, Ctrl-C, ...)
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(tmp_path)
+                raise
+
+            sha256 = digest.hexdigest()
+            etag = resp.headers.get("etag")
+            last_modified = resp.headers.get("last-modified")
 
-        if not os.path.exists(dest_dir):
-            os.makedirs(dest_dir)  # Create directory if it does not exist
+    manifest[url] = {"etag": etag, "last_modified": last_modified, "sha256": sha256}
 
-        # Save image to the specified directory
-        with open(f"{dest_dir}/{tag}-{file_name}.jpeg", "wb") as f:
-            f.write(resp.content)
-            logging.info(f"Saved {file_name}, with size {round(len(resp.content) / 1024 / 1024, 2)} MB.")
+    # No validator to revalidate with: fall back to comparing content hashes
+    if meta and meta.get("sha256") == sha256:
+        os.remove(tmp_path)
+        logging.info(f"{file_name} unchanged. Skipping.")
+        return
+
+    os.replace(tmp_path, file_path)  # Move the completed image into place
+    logging.info(f"Saved {file_name}, with size {round(size / 1024 / 1024, 2)} MB.")
+
+
+def _load_manifest(path: str) -> dict:
+    """ Loads the per-URL ETag / Last-Modified / sha256 manifest, or an empty one if it does not exist.
+    """
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_manifest(path: str, manifest: dict):
+    """ Writes the per-URL manifest to disk.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)  # Create manifest directory if it does not exist
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2)
 
 
 if __name__ == '__main__':